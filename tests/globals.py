@@ -5,14 +5,17 @@ import numpy as np
 
 SEED = 12
 
+_X = np.array([[0, 1, 0, 1], [0, 0, 0, 0], [1, 1, 1, 1], [1, 1, 1, 1], [0, 0, 1, 1], [1, 0, 0, 0]])  # _X.shape = (6, 4)
+_YC = np.reshape(np.array([1, 1, 0, 0, 1, 1]), (_X.shape[0], 1))
+_YM = np.array([[1, 1], [1, 0], [0, 0], [0, 0], [1, 0], [1, 1]])
+_YR = _YC.copy()
 
-@pytest.fixture
-def sample_data():
-    """Return sample data for testing."""
-    X = np.array([[0, 1, 0, 1], [0, 0, 0, 0], [1, 1, 1, 1], [1, 1, 1, 1], [0, 0, 1, 1], [1, 0, 0, 0]])  # X.shape = (6, 4)
+# The sample arrays are shared by every test in the session, so guard them against accidental mutation
+for _arr in (_X, _YC, _YM, _YR):
+    _arr.flags.writeable = False
 
-    y_classifier = np.reshape(np.array([1, 1, 0, 0, 1, 1]), (X.shape[0], 1))
-    y_multiclass = np.array([[1, 1], [1, 0], [0, 0], [0, 0], [1, 0], [1, 1]])
-    y_regressor = y_classifier.copy()
 
-    return X, y_classifier, y_multiclass, y_regressor
+@pytest.fixture(scope="session")
+def sample_data():
+    """Return sample data for testing."""
+    return _X, _YC, _YM, _YR
@@ -4,8 +4,9 @@
 # License: BSD 3-clause
 
 import numpy as np
+import pytest
 
-from tests.globals import sample_data
+from tests.globals import SEED, sample_data
 from mlrose_ky import identity
 from mlrose_ky.neural.linear_regression import LinearRegression
 
@@ -13,10 +14,19 @@ from mlrose_ky.neural.linear_regression import LinearRegression
 class TestLinearRegression:
     """Test cases for the LinearRegression class."""
 
-    def test_fit_random_hill_climb(self, sample_data):
-        """Test fitting LinearRegression using random hill climb."""
+    @pytest.mark.parametrize(
+        "algorithm, kwargs",
+        [
+            ("random_hill_climb", {"learning_rate": 1}),
+            ("simulated_annealing", {"learning_rate": 1}),
+            pytest.param("genetic_alg", {"learning_rate": 1, "max_attempts": 1}, marks=pytest.mark.slow),
+            ("gradient_descent", {}),
+        ],
+    )
+    def test_fit(self, sample_data, algorithm, kwargs):
+        """Test fitting LinearRegression using each optimization algorithm."""
         X, y_classifier, _, _ = sample_data
-        network = LinearRegression(bias=False, learning_rate=1, clip_max=1)
+        network = LinearRegression(algorithm=algorithm, bias=False, clip_max=1, random_state=SEED, **kwargs)
 
         num_weights = X.shape[1]
         weights = np.ones(num_weights)
@@ -24,52 +34,22 @@ class TestLinearRegression:
         network.fit(X, y_classifier, init_weights=weights)
         fitted = network.fitted_weights
 
-        assert sum(fitted) < num_weights and len(fitted) == num_weights and min(fitted) >= -1 and max(fitted) <= 1
-
-    def test_fit_simulated_annealing(self, sample_data):
-        """Test fitting LinearRegression using simulated annealing."""
-        X, y_classifier, _, _ = sample_data
-        network = LinearRegression(algorithm="simulated_annealing", bias=False, learning_rate=1, clip_max=1)
-
-        num_weights = X.shape[1]
-        weights = np.ones(num_weights)
-
-        network.fit(X, y_classifier, init_weights=weights)
-        fitted = network.fitted_weights
-
-        assert sum(fitted) < num_weights and len(fitted) == num_weights and min(fitted) >= -1 and max(fitted) <= 1
-
-    def test_fit_genetic_alg(self, sample_data):
-        """Test fitting LinearRegression using genetic algorithm."""
-        X, y_classifier, _, _ = sample_data
-        network = LinearRegression(algorithm="genetic_alg", bias=False, learning_rate=1, clip_max=1, max_attempts=1)
-
-        num_weights = X.shape[1]
-        weights = np.ones(num_weights)
-
-        network.fit(X, y_classifier, init_weights=weights)
-        fitted = network.fitted_weights
-
-        assert sum(fitted) < num_weights and len(fitted) == num_weights and min(fitted) >= -1 and max(fitted) <= 1
-
-    def test_fit_gradient_descent(self, sample_data):
-        """Test fitting LinearRegression using gradient descent."""
-        X, y_classifier, _, _ = sample_data
-        network = LinearRegression(algorithm="gradient_descent", bias=False, clip_max=1)
-
-        num_weights = X.shape[1]
-        weights = np.ones(num_weights)
-
-        network.fit(X, y_classifier, init_weights=weights)
-        fitted = network.fitted_weights
-
-        assert sum(fitted) < num_weights and len(fitted) == num_weights and min(fitted) >= -1 and max(fitted) <= 1
+        assert len(fitted) == num_weights
+        assert sum(fitted) < num_weights
+        assert min(fitted) >= -1
+        assert max(fitted) <= 1
 
     def test_predict_no_bias(self, sample_data):
         """Test prediction without bias in LinearRegression."""
         X, _, _, _ = sample_data
         bias = False
-        network = LinearRegression(bias=bias, learning_rate=1, clip_max=1)
+
+        # Bypass the constructor; predict only reads the attributes set below
+        network = LinearRegression.__new__(LinearRegression)
+        network.activation_dict = {"identity": identity}
+        network.activation = "identity"
+        network.bias = bias
+        network.is_classifier = False
 
         first_layer_size = X.shape[1] + (1 if bias else 0)
 
@@ -84,7 +64,13 @@ class TestLinearRegression:
         """Test prediction with bias in LinearRegression."""
         X, _, _, _ = sample_data
         bias = True
-        network = LinearRegression(bias=bias, learning_rate=1, clip_max=1)
+
+        # Bypass the constructor; predict only reads the attributes set below
+        network = LinearRegression.__new__(LinearRegression)
+        network.activation_dict = {"identity": identity}
+        network.activation = "identity"
+        network.bias = bias
+        network.is_classifier = False
 
         first_layer_size = X.shape[1] + (1 if bias else 0)
 
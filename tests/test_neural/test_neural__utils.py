@@ -57,12 +57,19 @@ def mock_problem():
     return MockProblem([1, 2, 3, 4])
 
 
+@pytest.fixture(scope="session")
+def flatten_scaffold():
+    """Fixture providing layer weights, their flattened form, and the matching node list."""
+    weights = [np.array([[1, 2], [3, 4]]), np.array([[5], [6]])]
+    flat_weights = np.array([1, 2, 3, 4, 5, 6])
+    return weights, flat_weights, [2, 2, 1]
+
+
 class TestNeuralOptimizationFunctions:
     """Test cases for neural network weight optimization functions."""
 
-    def test_flatten_weights(self):
-        weights = [np.array([[1, 2], [3, 4]]), np.array([[5], [6]])]
-        expected_output = np.array([1, 2, 3, 4, 5, 6])
+    def test_flatten_weights(self, flatten_scaffold):
+        weights, expected_output, _ = flatten_scaffold
         flat_weights = flatten_weights(weights)
 
         assert np.array_equal(flat_weights, expected_output)
@@ -73,10 +80,8 @@ class TestNeuralOptimizationFunctions:
 
         assert flat_weights.size == 0
 
-    def test_unflatten_weights(self):
-        flat_weights = np.array([1, 2, 3, 4, 5, 6])
-        node_list = [2, 2, 1]
-        expected_output = [np.array([[1, 2], [3, 4]]), np.array([[5], [6]])]
+    def test_unflatten_weights(self, flatten_scaffold):
+        expected_output, flat_weights, node_list = flatten_scaffold
         weights = unflatten_weights(flat_weights, node_list)
 
         for w, ew in zip(weights, expected_output):